@@ -11,22 +11,23 @@ export async function GET(request: NextRequest) {
   try {
     // Get all data connections from the database
     // For now, return mock data
+    const now = new Date().toISOString();
     const connections = [
       {
         id: 'conn-1',
         name: 'Google Analytics Data',
         type: 'bigquery',
         status: 'active',
-        lastConnected: new Date().toISOString(),
-        createdAt: new Date().toISOString()
+        lastConnected: now,
+        createdAt: now
       },
       {
         id: 'conn-2',
         name: 'Marketing Campaign Spreadsheet',
         type: 'spreadsheet',
         status: 'active',
-        lastConnected: new Date().toISOString(),
-        createdAt: new Date().toISOString()
+        lastConnected: now,
+        createdAt: now
       },
       {
         id: 'conn-3',
@@ -34,7 +35,7 @@ export async function GET(request: NextRequest) {
         type: 'csv',
         status: 'inactive',
         lastConnected: new Date(Date.now() - 30 * 24 * 60 * 60 * 1000).toISOString(),
-        createdAt: new Date().toISOString()
+        createdAt: now
       }
     ];
     
@@ -88,14 +89,15 @@ export async function POST(request: NextRequest) {
     }
     
     // Create a new connection
+    const now = new Date().toISOString();
     const newConnection = {
       id: `conn-${uuidv4()}`,
       name,
       type,
       config,
       status: 'active',
-      lastConnected: new Date().toISOString(),
-      createdAt: new Date().toISOString()
+      lastConnected: now,
+      createdAt: now
     };
     
     // In a real implementation, save to database
@@ -215,7 +217,7 @@ def test_bigquery_connection(config):
             client = bigquery.Client(project=project_id)
         
         # Test connection by listing tables in the dataset
-        dataset_ref = client.dataset(dataset_id)
+        dataset_ref = bigquery.DatasetReference(project_id, dataset_id)
         tables = list(client.list_tables(dataset_ref))
         
         return {"success": True, "message": f"Successfully connected to BigQuery. Found {len(tables)} tables."}
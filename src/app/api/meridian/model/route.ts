@@ -16,10 +16,12 @@ export async function POST(request: NextRequest) {
     }
     
     // Fetch data from the specified data source
+    // Meridian processing needs JSON records, so Arrow output is never requested
     const sourceConfig = {
       type: dataConfig?.type || 'bigquery',
       id: dataSourceId,
-      ...dataConfig
+      ...dataConfig,
+      format: undefined
     };
     
     // Fetch data from the source
@@ -33,39 +33,38 @@ export async function POST(request: NextRequest) {
     // Generate mock HTML content for the report
     const htmlContent = generateMockReportHtml(title, description, type, channels, metrics);
     
-    // Save the report to the database
-    const db = await getDb();
-    await db.prepare(
-      `INSERT INTO reports (id, title, description, type, config, user_id, html_content, created_at, updated_at)
-       VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)`
-    ).bind(
-      reportId,
-      title,
-      description || '',
-      type,
-      JSON.stringify(config),
-      userId,
-      htmlContent
-    ).run();
-    
     // Generate insights for the report
     const insights = generateMockInsights(type, channels, metrics);
     
-    // Save insights to the database
-    for (const insight of insights) {
-      const insightId = uuidv4();
-      await db.prepare(
-        `INSERT INTO insights (id, title, explanation, recommendation, report_id, user_id, created_at)
-         VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)`
+    // Save the report and its insights in a single batch so the inserts
+    // share one round-trip to the database instead of awaiting each in turn
+    const db = await getDb();
+    const insertInsight = db.prepare(
+      `INSERT INTO insights (id, title, explanation, recommendation, report_id, user_id, created_at)
+       VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)`
+    );
+    await db.batch([
+      db.prepare(
+        `INSERT INTO reports (id, title, description, type, config, user_id, html_content, created_at, updated_at)
+         VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)`
       ).bind(
-        insightId,
+        reportId,
+        title,
+        description || '',
+        type,
+        JSON.stringify(config),
+        userId,
+        htmlContent
+      ),
+      ...insights.map(insight => insertInsight.bind(
+        uuidv4(),
         insight.title,
         insight.explanation,
         insight.recommendation,
         reportId,
         userId
-      ).run();
-    }
+      ))
+    ]);
     
     return NextResponse.json({
       message: 'Report generated successfully',
@@ -19,8 +19,11 @@ export interface Report {
 export async function GET(request: NextRequest) {
   try {
     const db = await getDb();
+    // List metadata only; html_content holds the full rendered report and
+    // would otherwise be read and serialized for every row
     const reports = await db.prepare(
-      "SELECT * FROM reports ORDER BY created_at DESC"
+      `SELECT id, title, description, type, config, user_id, created_at, updated_at
+       FROM reports ORDER BY created_at DESC`
     ).all();
     
     return NextResponse.json({ data: reports.results }, { status: 200 });
@@ -3,7 +3,8 @@ import path from 'path';
 import fs from 'fs';
 
 // Helper function to run Python scripts for data processing
-export async function runPythonScript(scriptName: string, args: string[] = []): Promise<any> {
+// If input is given, it is written to the script's stdin
+export async function runPythonScript(scriptName: string, args: string[] = [], input?: string): Promise<any> {
   try {
     const scriptPath = path.join(process.cwd(), 'src', 'lib', 'python', scriptName);
     
@@ -18,7 +19,9 @@ export async function runPythonScript(scriptName: string, args: string[] = []):
       args
     };
     
-    const results = await PythonShell.run(scriptPath, options);
+    const results = input === undefined
+      ? await PythonShell.run(scriptPath, options)
+      : await runPythonScriptWithInput(scriptPath, options, input);
     
     // Parse the results if they are JSON
     try {
@@ -33,6 +36,18 @@ export async function runPythonScript(scriptName: string, args: string[] = []):
   }
 }
 
+// Run a Python script with input written to its stdin, collecting its output lines
+function runPythonScriptWithInput(scriptPath: string, options: any, input: string): Promise<string[]> {
+  return new Promise((resolve, reject) => {
+    const shell = new PythonShell(scriptPath, options);
+    const results: string[] = [];
+    
+    shell.on('message', (message: string) => results.push(message));
+    shell.send(input);
+    shell.end((error) => error ? reject(error) : resolve(results));
+  });
+}
+
 // Function to create a Python script if it doesn't exist
 export function createPythonScript(scriptName: string, content: string): void {
   const scriptDir = path.join(process.cwd(), 'src', 'lib', 'python');
@@ -54,12 +69,71 @@ export function createPythonScript(scriptName: string, content: string): void {
 export function createMeridianDataProcessingScript(): void {
   const scriptName = 'process_data_for_meridian.py';
   const scriptContent = `
+import argparse
 import json
 import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+def _loads(text):
+    """Parse a JSON string or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _dumps(obj):
+    """Serialize a response to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_numpy_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, default=_numpy_default)
+
+def _numpy_default(value):
+    """Convert numpy values the JSON encoder cannot handle natively"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def column_values(series):
+    """Column values as a contiguous numpy array when numeric, otherwise as a list"""
+    values = series.to_numpy()
+    if values.dtype.kind in 'biuf':
+        # A column sliced out of a row-major block is strided; orjson only
+        # serializes contiguous arrays natively. This is a no-op otherwise.
+        return np.ascontiguousarray(values)
+    return series.tolist()
+
+def records_frame(records):
+    """Build a DataFrame from a list of flat record dicts"""
+    if pa is None:
+        return pd.DataFrame(records)
+    
+    # pyarrow converts the records straight into typed columns; mixed-type,
+    # nested or non-record input is left to pandas
+    try:
+        array = pa.array(records)
+        # pyarrow would turn null entries into all-null rows
+        if array.null_count:
+            return pd.DataFrame(records)
+        table = pa.Table.from_struct_array(array)
+    except (pa.ArrowException, TypeError, OverflowError):
+        return pd.DataFrame(records)
+    if any(pa.types.is_nested(field.type) for field in table.schema):
+        return pd.DataFrame(records)
+    return table.to_pandas(use_threads=True)
+
 def process_data_for_meridian(data_json, config_json=None):
     """
     Process marketing data for use with Meridian MMM.
@@ -73,44 +147,49 @@ def process_data_for_meridian(data_json, config_json=None):
     """
     try:
         # Parse input data
-        data = json.loads(data_json)
-        config = json.loads(config_json) if config_json else {}
+        data = _loads(data_json)
+        config = _loads(config_json) if config_json else {}
         
         # Convert to DataFrame if it's a list of records
         if isinstance(data, list):
-            df = pd.DataFrame(data)
+            df = records_frame(data)
         else:
             # Handle nested data structure
             if 'records' in data:
-                df = pd.DataFrame(data['records'])
+                df = records_frame(data['records'])
             else:
-                # Try to flatten the structure
-                flattened_data = []
-                for key, value in data.items():
-                    if isinstance(value, dict):
-                        row = {'date': key}
-                        row.update(value)
-                        flattened_data.append(row)
-                df = pd.DataFrame(flattened_data)
+                # Try to flatten the structure into one list per column,
+                # so pandas builds each column directly instead of from row dicts
+                rows = [(key, value) for key, value in data.items() if isinstance(value, dict)]
+                columns = {}
+                for _, value in rows:
+                    columns.update(dict.fromkeys(value))
+                columns.pop('date', None)
+                df = pd.DataFrame({
+                    'date': [value.get('date', key) for key, value in rows],
+                    **{col: [value.get(col) for _, value in rows] for col in columns}
+                })
         
         # Ensure date column is datetime
         date_column = config.get('date_column', 'date')
         if date_column in df.columns:
             df[date_column] = pd.to_datetime(df[date_column])
-            df = df.sort_values(by=date_column)
+            # Exports are usually chronological already, so only sort when needed
+            if not df[date_column].is_monotonic_increasing:
+                df = df.sort_values(by=date_column, kind='mergesort')
         
         # Identify target (KPI) column
         target_column = config.get('target_column')
         if not target_column:
             # Try to guess based on common names
-            potential_targets = ['revenue', 'sales', 'conversions', 'kpi', 'target']
-            for col in potential_targets:
-                if col in df.columns:
+            column_names = set(df.columns)
+            for col in ('revenue', 'sales', 'conversions', 'kpi', 'target'):
+                if col in column_names:
                     target_column = col
                     break
         
         if not target_column or target_column not in df.columns:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'Target KPI column not found or specified'
             })
@@ -118,18 +197,19 @@ def process_data_for_meridian(data_json, config_json=None):
         # Identify marketing channel columns
         channel_columns = config.get('channel_columns', [])
         if not channel_columns:
-            # Try to guess based on common patterns
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
-            # Exclude date and target columns
-            potential_channels = [col for col in numeric_cols 
-                                if col != target_column and 'date' not in col.lower()]
-            channel_columns = potential_channels
+            # Try to guess based on common patterns, walking the column dtypes
+            # directly rather than building a numeric-only frame first
+            numeric = np.fromiter((issubclass(dtype.type, np.number) for dtype in df.dtypes),
+                                  dtype=bool, count=len(df.columns))
+            # Exclude date and target columns, matching all names in one vectorized pass
+            is_date = df.columns.astype(str).str.contains('date', case=False, regex=False)
+            channel_columns = df.columns[numeric & ~is_date & (df.columns != target_column)].tolist()
         
         # Validate channel columns exist
         channel_columns = [col for col in channel_columns if col in df.columns]
         
         if not channel_columns:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'No marketing channel columns found or specified'
             })
@@ -138,26 +218,37 @@ def process_data_for_meridian(data_json, config_json=None):
         control_columns = config.get('control_columns', [])
         control_columns = [col for col in control_columns if col in df.columns]
         
+        # Format dates in a single vectorized numpy pass; the frame is sorted,
+        # so the range is its first and last valid date
+        dates = df[date_column]
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        date_values = dates.to_numpy(dtype='datetime64[D]')
+        missing_dates = np.isnat(date_values)
+        date_strings = np.datetime_as_string(date_values, unit='D')
+        date_bounds = date_strings[~missing_dates]
+        date_list = date_strings.astype(object)
+        date_list[missing_dates] = None
+        
         # Format data for Meridian
         meridian_data = {
-            'date': df[date_column].dt.strftime('%Y-%m-%d').tolist(),
-            'target': df[target_column].tolist(),
-            'channels': {}
+            'date': date_list.tolist(),
+            'target': column_values(df[target_column]),
+            # Slice the selected columns once and walk them, rather than
+            # looking each one up on the full frame
+            'channels': {col: column_values(values)
+                         for col, values in df.loc[:, channel_columns].items()}
         }
         
-        for channel in channel_columns:
-            meridian_data['channels'][channel] = df[channel].tolist()
-        
         if control_columns:
-            meridian_data['controls'] = {}
-            for control in control_columns:
-                meridian_data['controls'][control] = df[control].tolist()
+            meridian_data['controls'] = {col: column_values(values)
+                                         for col, values in df.loc[:, control_columns].items()}
         
         # Add metadata
         meridian_data['metadata'] = {
             'date_range': {
-                'start': df[date_column].min().strftime('%Y-%m-%d'),
-                'end': df[date_column].max().strftime('%Y-%m-%d')
+                'start': str(date_bounds[0]),
+                'end': str(date_bounds[-1])
             },
             'target_column': target_column,
             'channel_columns': channel_columns,
@@ -166,27 +257,51 @@ def process_data_for_meridian(data_json, config_json=None):
             'processed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        return json.dumps({
+        return _dumps({
             'success': True,
             'data': meridian_data
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
 
+def read_input(path):
+    """Read raw JSON bytes from a file path, or from stdin when the path is '-'"""
+    if path == '-':
+        return sys.stdin.buffer.read()
+    with open(path, 'rb') as f:
+        return f.read()
+
 if __name__ == "__main__":
-    # Get input data from command line arguments
-    if len(sys.argv) > 1:
-        data_json = sys.argv[1]
-        config_json = sys.argv[2] if len(sys.argv) > 2 else None
-        
+    # Input data can be passed inline, as '-' to read it from stdin, or as a file.
+    # stdin and files avoid the OS limit on command line argument size.
+    parser = argparse.ArgumentParser(description='Process marketing data for Meridian')
+    parser.add_argument('data_json', nargs='?', help="JSON string with the marketing data, or '-' for stdin")
+    parser.add_argument('config_json', nargs='?', help='JSON string with processing configuration')
+    parser.add_argument('--data-file', help='Path to a JSON file with the marketing data')
+    parser.add_argument('--config-file', help='Path to a JSON file with processing configuration')
+    args = parser.parse_args()
+    
+    try:
+        data_json = read_input(args.data_file) if args.data_file else args.data_json
+        if data_json == '-':
+            data_json = read_input('-')
+        config_json = read_input(args.config_file) if args.config_file else args.config_json
+    except OSError as e:
+        print(_dumps({
+            'success': False,
+            'message': str(e)
+        }))
+        sys.exit()
+    
+    if data_json:
         result = process_data_for_meridian(data_json, config_json)
         print(result)
     else:
-        print(json.dumps({
+        print(_dumps({
             'success': False,
             'message': 'No input data provided'
         }))
@@ -199,6 +314,7 @@ if __name__ == "__main__":
 export function createDataFetchingScript(): void {
   const scriptName = 'fetch_data.py';
   const scriptContent = `
+import base64
 import json
 import sys
 import pandas as pd
@@ -206,6 +322,54 @@ import numpy as np
 from datetime import datetime
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+try:
+    import python_calamine  # noqa: F401
+    # pandas only accepts engine='calamine' from 2.2 onwards
+    pandas_version = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_ENGINE = 'calamine' if pandas_version >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None
+
+# Tokens pd.read_csv treats as missing by default
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+def _loads(text):
+    """Parse a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _dumps(obj):
+    """Serialize a response to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=_numpy_default)
+
+def _numpy_default(value):
+    """Convert numpy scalars for the stdlib json fallback"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def _timestamp():
+    """Current local time as 'YYYY-MM-DD HH:MM:SS' without going through strftime"""
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
 def fetch_data_from_source(config_json):
     """
     Fetch data from various data sources based on configuration.
@@ -218,34 +382,33 @@ def fetch_data_from_source(config_json):
     """
     try:
         # Parse configuration
-        config = json.loads(config_json)
+        config = _loads(config_json)
         source_type = config.get('type')
         
         if not source_type:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'Source type not specified'
             })
         
+        if config.get('format') == 'arrow' and pa is None:
+            return _dumps({
+                'success': False,
+                'message': 'Arrow output requires the pyarrow package'
+            })
+        
         # Fetch data based on source type
-        if source_type == 'csv':
-            return fetch_from_csv(config)
-        elif source_type == 'excel':
-            return fetch_from_excel(config)
-        elif source_type == 'bigquery':
-            return fetch_from_bigquery(config)
-        elif source_type == 'spreadsheet':
-            return fetch_from_spreadsheet(config)
-        elif source_type == 'database':
-            return fetch_from_database(config)
-        else:
-            return json.dumps({
+        fetcher = SOURCE_FETCHERS.get(source_type)
+        if fetcher is None:
+            return _dumps({
                 'success': False,
                 'message': f'Unsupported source type: {source_type}'
             })
+        
+        return fetcher(config)
             
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
@@ -255,44 +418,85 @@ def fetch_from_csv(config):
     try:
         file_path = config.get('filePath')
         if not file_path:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'File path not specified'
             })
             
         # Check if file exists
         if not os.path.exists(file_path):
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': f'File not found: {file_path}'
             })
             
+        # Return columnar Arrow data if requested
+        if config.get('format') == 'arrow':
+            table = read_csv_table(file_path)
+            return arrow_response(table if table is not None else pd.read_csv(file_path))
+        
         # Read CSV file
-        df = pd.read_csv(file_path)
+        columns, records = read_csv_records(file_path)
         
         # Basic data info
         data_info = {
-            'row_count': len(df),
-            'column_count': len(df.columns),
-            'columns': df.columns.tolist(),
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'row_count': len(records),
+            'column_count': len(columns),
+            'columns': columns,
+            'fetched_at': _timestamp()
         }
         
-        # Convert to records
-        records = df.to_dict(orient='records')
-        
-        return json.dumps({
+        return _dumps({
             'success': True,
             'info': data_info,
             'data': records
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
 
+def read_csv_table(file_path):
+    """Read a CSV file into a pyarrow Table, or None when it should be left to pd.read_csv"""
+    if pacsv is None:
+        return None
+    
+    # pyarrow parses the file with multiple threads straight into columns,
+    # treating the same tokens as missing as pandas does
+    convert_options = pacsv.ConvertOptions(null_values=CSV_NA_VALUES, strings_can_be_null=True)
+    try:
+        table = pacsv.read_csv(file_path, convert_options=convert_options)
+        columns = table.column_names
+        
+        # pandas renames blank and repeated headers and decodes text strictly,
+        # so leave those files to it
+        if ('' in columns or len(set(columns)) != len(columns)
+                or any(pa.types.is_binary(field.type) for field in table.schema)):
+            return None
+        
+        # Re-read date-like columns as text so values match the file, as pandas keeps them
+        temporal = {field.name: pa.string() for field in table.schema
+                    if pa.types.is_temporal(field.type)}
+        if temporal:
+            convert_options.column_types = temporal
+            table = pacsv.read_csv(file_path, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        # Rows with missing trailing fields and other input pandas tolerates
+        return None
+    
+    return table
+
+def read_csv_records(file_path):
+    """Read a CSV file into its column names and a list of row records"""
+    table = read_csv_table(file_path)
+    if table is not None:
+        return table.column_names, table.to_pylist()
+    
+    df = pd.read_csv(file_path)
+    return df.columns.tolist(), df.to_dict(orient='records')
+
 def fetch_from_excel(config):
     """Fetch data from Excel file"""
     try:
@@ -300,43 +504,51 @@ def fetch_from_excel(config):
         sheet_name = config.get('sheetName')
         
         if not file_path:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'File path not specified'
             })
             
         # Check if file exists
         if not os.path.exists(file_path):
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': f'File not found: {file_path}'
             })
             
         # Read Excel file
-        if sheet_name:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+        if isinstance(sheet_name, list) and sheet_name:
+            # Read all requested sheets from a single pass over the workbook
+            sheets = pd.read_excel(file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
+            df = pd.concat(sheets.values(), ignore_index=True)
+        elif sheet_name:
+            df = pd.read_excel(file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
         else:
-            df = pd.read_excel(file_path)
+            df = pd.read_excel(file_path, engine=EXCEL_ENGINE)
+        
+        # Return columnar Arrow data if requested
+        if config.get('format') == 'arrow':
+            return arrow_response(df)
         
         # Basic data info
         data_info = {
             'row_count': len(df),
             'column_count': len(df.columns),
             'columns': df.columns.tolist(),
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'fetched_at': _timestamp()
         }
         
         # Convert to records
         records = df.to_dict(orient='records')
         
-        return json.dumps({
+        return _dumps({
             'success': True,
             'info': data_info,
             'data': records
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
@@ -346,49 +558,10 @@ def fetch_from_bigquery(config):
     try:
         # In a real implementation, this would use the google-cloud-bigquery package
         # For this demo, we'll return mock data
-        
-        # Mock data generation
-        date_range = pd.date_range(start='2025-01-01', periods=90)
-        channels = ['Paid Search', 'Social Media', 'Email', 'Display']
-        
-        data = []
-        for date in date_range:
-            row = {'date': date.strftime('%Y-%m-%d')}
-            
-            # Add channel data
-            for channel in channels:
-                # Generate some random spend data
-                row[f'{channel}_spend'] = round(np.random.gamma(2, 100), 2)
-                
-                # Generate some random performance metrics
-                row[f'{channel}_impressions'] = int(np.random.gamma(2, 1000))
-                row[f'{channel}_clicks'] = int(np.random.gamma(2, 50))
-                row[f'{channel}_conversions'] = int(np.random.gamma(2, 5))
-            
-            # Add revenue data with some relationship to marketing
-            base_revenue = 5000
-            marketing_effect = sum([row[f'{channel}_spend'] * np.random.uniform(0.5, 2.0) for channel in channels])
-            row['revenue'] = round(base_revenue + marketing_effect + np.random.normal(0, 1000), 2)
-            
-            data.append(row)
-        
-        # Basic data info
-        data_info = {
-            'row_count': len(data),
-            'column_count': len(data[0]) if data else 0,
-            'columns': list(data[0].keys()) if data else [],
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'source': 'BigQuery (mock data)'
-        }
-        
-        return json.dumps({
-            'success': True,
-            'info': data_info,
-            'data': data
-        })
+        return generate_mock_data('BigQuery (mock data)', config)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
@@ -398,49 +571,10 @@ def fetch_from_spreadsheet(config):
     try:
         # In a real implementation, this would use the gspread package
         # For this demo, we'll return mock data
-        
-        # Mock data generation
-        date_range = pd.date_range(start='2025-01-01', periods=90)
-        channels = ['Paid Search', 'Social Media', 'Email', 'Display']
-        
-        data = []
-        for date in date_range:
-            row = {'date': date.strftime('%Y-%m-%d')}
-            
-            # Add channel data
-            for channel in channels:
-                # Generate some random spend data
-                row[f'{channel}_spend'] = round(np.random.gamma(2, 100), 2)
-                
-                # Generate some random performance metrics
-                row[f'{channel}_impressions'] = int(np.random.gamma(2, 1000))
-                row[f'{channel}_clicks'] = int(np.random.gamma(2, 50))
-                row[f'{channel}_conversions'] = int(np.random.gamma(2, 5))
-            
-            # Add revenue data with some relationship to marketing
-            base_revenue = 5000
-            marketing_effect = sum([row[f'{channel}_spend'] * np.random.uniform(0.5, 2.0) for channel in channels])
-            row['revenue'] = round(base_revenue + marketing_effect + np.random.normal(0, 1000), 2)
-            
-            data.append(row)
-        
-        # Basic data info
-        data_info = {
-            'row_count': len(data),
-            'column_count': len(data[0]) if data else 0,
-            'columns': list(data[0].keys()) if data else [],
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'source': 'Google Spreadsheet (mock data)'
-        }
-        
-        return json.dumps({
-            'success': True,
-            'info': data_info,
-            'data': data
-        })
+        return generate_mock_data('Google Spreadsheet (mock data)', config)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
@@ -450,53 +584,104 @@ def fetch_from_database(config):
     try:
         # In a real implementation, this would use SQLAlchemy
         # For this demo, we'll return mock data
-        
-        # Mock data generation
-        date_range = pd.date_range(start='2025-01-01', periods=90)
-        channels = ['Paid Search', 'Social Media', 'Email', 'Display']
-        
-        data = []
-        for date in date_range:
-            row = {'date': date.strftime('%Y-%m-%d')}
-            
-            # Add channel data
-            for channel in channels:
-                # Generate some random spend data
-                row[f'{channel}_spend'] = round(np.random.gamma(2, 100), 2)
-                
-                # Generate some random performance metrics
-                row[f'{channel}_impressions'] = int(np.random.gamma(2, 1000))
-                row[f'{channel}_clicks'] = int(np.random.gamma(2, 50))
-                row[f'{channel}_conversions'] = int(np.random.gamma(2, 5))
-            
-            # Add revenue data with some relationship to marketing
-            base_revenue = 5000
-            marketing_effect = sum([row[f'{channel}_spend'] * np.random.uniform(0.5, 2.0) for channel in channels])
-            row['revenue'] = round(base_revenue + marketing_effect + np.random.normal(0, 1000), 2)
-            
-            data.append(row)
-        
-        # Basic data info
-        data_info = {
-            'row_count': len(data),
-            'column_count': len(data[0]) if data else 0,
-            'columns': list(data[0].keys()) if data else [],
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'source': 'Database (mock data)'
-        }
-        
-        return json.dumps({
-            'success': True,
-            'info': data_info,
-            'data': data
-        })
+        return generate_mock_data('Database (mock data)', config)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
 
+def generate_mock_data(source, config, periods=90):
+    """Generate mock daily marketing data, one column at a time"""
+    rng = np.random.default_rng()
+    date_range = pd.date_range(start='2025-01-01', periods=periods)
+    channels = ['Paid Search', 'Social Media', 'Email', 'Display']
+    
+    columns = {'date': date_range.strftime('%Y-%m-%d')}
+    marketing_effect = np.zeros(periods)
+    for channel in channels:
+        # Generate some random spend data
+        spend = rng.gamma(2, 100, periods).round(2)
+        columns[f'{channel}_spend'] = spend
+        
+        # Generate some random performance metrics
+        columns[f'{channel}_impressions'] = rng.gamma(2, 1000, periods).astype(np.int64)
+        columns[f'{channel}_clicks'] = rng.gamma(2, 50, periods).astype(np.int64)
+        columns[f'{channel}_conversions'] = rng.gamma(2, 5, periods).astype(np.int64)
+        
+        marketing_effect += spend * rng.uniform(0.5, 2.0, periods)
+    
+    # Add revenue data with some relationship to marketing
+    base_revenue = 5000
+    columns['revenue'] = (base_revenue + marketing_effect + rng.normal(0, 1000, periods)).round(2)
+    
+    df = pd.DataFrame(columns)
+    
+    # Return columnar Arrow data if requested
+    if config.get('format') == 'arrow':
+        return arrow_response(df, source=source)
+    
+    data = df.to_dict(orient='records')
+    
+    # Basic data info
+    data_info = {
+        'row_count': len(data),
+        'column_count': len(columns),
+        'columns': list(columns),
+        'fetched_at': _timestamp(),
+        'source': source
+    }
+    
+    return _dumps({
+        'success': True,
+        'info': data_info,
+        'data': data
+    })
+
+def arrow_response(data, **info):
+    """
+    Build a response carrying the data as a base64-encoded Arrow IPC stream.
+    
+    Args:
+        data: pyarrow Table or pandas DataFrame with the fetched data
+        **info: Extra fields for the response info block
+    
+    Returns:
+        JSON string with the encoded data
+    """
+    if isinstance(data, pd.DataFrame):
+        data = pa.Table.from_pandas(data, preserve_index=False)
+    
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, data.schema) as writer:
+        writer.write_table(data)
+    
+    # Basic data info
+    data_info = {
+        'row_count': data.num_rows,
+        'column_count': data.num_columns,
+        'columns': data.column_names,
+        'fetched_at': _timestamp(),
+        'format': 'arrow',
+        **info
+    }
+    
+    return _dumps({
+        'success': True,
+        'info': data_info,
+        'data': base64.b64encode(sink.getvalue().to_pybytes()).decode('ascii')
+    })
+
+# Fetch functions by source type
+SOURCE_FETCHERS = {
+    'csv': fetch_from_csv,
+    'excel': fetch_from_excel,
+    'bigquery': fetch_from_bigquery,
+    'spreadsheet': fetch_from_spreadsheet,
+    'database': fetch_from_database
+}
+
 if __name__ == "__main__":
     # Get input data from command line arguments
     if len(sys.argv) > 1:
@@ -504,7 +689,7 @@ if __name__ == "__main__":
         result = fetch_data_from_source(config_json)
         print(result)
     else:
-        print(json.dumps({
+        print(_dumps({
             'success': False,
             'message': 'No configuration provided'
         }))
@@ -533,7 +718,8 @@ export async function processDataForMeridian(data: any, config: any = {}): Promi
   try {
     const dataJson = JSON.stringify(data);
     const configJson = JSON.stringify(config);
-    return await runPythonScript('process_data_for_meridian.py', [dataJson, configJson]);
+    // Send the data over stdin; large datasets exceed the OS argument size limit
+    return await runPythonScript('process_data_for_meridian.py', ['-', configJson], dataJson);
   } catch (error) {
     console.error('Error processing data for Meridian:', error);
     throw error;
@@ -1,4 +1,5 @@
 
+import base64
 import json
 import sys
 import pandas as pd
@@ -6,6 +7,54 @@ import numpy as np
 from datetime import datetime
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+try:
+    import python_calamine  # noqa: F401
+    # pandas only accepts engine='calamine' from 2.2 onwards
+    pandas_version = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_ENGINE = 'calamine' if pandas_version >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None
+
+# Tokens pd.read_csv treats as missing by default
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+def _loads(text):
+    """Parse a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _dumps(obj):
+    """Serialize a response to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=_numpy_default)
+
+def _numpy_default(value):
+    """Convert numpy scalars for the stdlib json fallback"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def _timestamp():
+    """Current local time as 'YYYY-MM-DD HH:MM:SS' without going through strftime"""
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
 def fetch_data_from_source(config_json):
     """
     Fetch data from various data sources based on configuration.
@@ -18,34 +67,33 @@ def fetch_data_from_source(config_json):
     """
     try:
         # Parse configuration
-        config = json.loads(config_json)
+        config = _loads(config_json)
         source_type = config.get('type')
         
         if not source_type:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'Source type not specified'
             })
         
+        if config.get('format') == 'arrow' and pa is None:
+            return _dumps({
+                'success': False,
+                'message': 'Arrow output requires the pyarrow package'
+            })
+        
         # Fetch data based on source type
-        if source_type == 'csv':
-            return fetch_from_csv(config)
-        elif source_type == 'excel':
-            return fetch_from_excel(config)
-        elif source_type == 'bigquery':
-            return fetch_from_bigquery(config)
-        elif source_type == 'spreadsheet':
-            return fetch_from_spreadsheet(config)
-        elif source_type == 'database':
-            return fetch_from_database(config)
-        else:
-            return json.dumps({
+        fetcher = SOURCE_FETCHERS.get(source_type)
+        if fetcher is None:
+            return _dumps({
                 'success': False,
                 'message': f'Unsupported source type: {source_type}'
             })
+        
+        return fetcher(config)
             
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
@@ -55,44 +103,85 @@ def fetch_from_csv(config):
     try:
         file_path = config.get('filePath')
         if not file_path:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'File path not specified'
             })
             
         # Check if file exists
         if not os.path.exists(file_path):
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': f'File not found: {file_path}'
             })
             
+        # Return columnar Arrow data if requested
+        if config.get('format') == 'arrow':
+            table = read_csv_table(file_path)
+            return arrow_response(table if table is not None else pd.read_csv(file_path))
+        
         # Read CSV file
-        df = pd.read_csv(file_path)
+        columns, records = read_csv_records(file_path)
         
         # Basic data info
         data_info = {
-            'row_count': len(df),
-            'column_count': len(df.columns),
-            'columns': df.columns.tolist(),
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'row_count': len(records),
+            'column_count': len(columns),
+            'columns': columns,
+            'fetched_at': _timestamp()
         }
         
-        # Convert to records
-        records = df.to_dict(orient='records')
-        
-        return json.dumps({
+        return _dumps({
             'success': True,
             'info': data_info,
             'data': records
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
 
+def read_csv_table(file_path):
+    """Read a CSV file into a pyarrow Table, or None when it should be left to pd.read_csv"""
+    if pacsv is None:
+        return None
+    
+    # pyarrow parses the file with multiple threads straight into columns,
+    # treating the same tokens as missing as pandas does
+    convert_options = pacsv.ConvertOptions(null_values=CSV_NA_VALUES, strings_can_be_null=True)
+    try:
+        table = pacsv.read_csv(file_path, convert_options=convert_options)
+        columns = table.column_names
+        
+        # pandas renames blank and repeated headers and decodes text strictly,
+        # so leave those files to it
+        if ('' in columns or len(set(columns)) != len(columns)
+                or any(pa.types.is_binary(field.type) for field in table.schema)):
+            return None
+        
+        # Re-read date-like columns as text so values match the file, as pandas keeps them
+        temporal = {field.name: pa.string() for field in table.schema
+                    if pa.types.is_temporal(field.type)}
+        if temporal:
+            convert_options.column_types = temporal
+            table = pacsv.read_csv(file_path, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        # Rows with missing trailing fields and other input pandas tolerates
+        return None
+    
+    return table
+
+def read_csv_records(file_path):
+    """Read a CSV file into its column names and a list of row records"""
+    table = read_csv_table(file_path)
+    if table is not None:
+        return table.column_names, table.to_pylist()
+    
+    df = pd.read_csv(file_path)
+    return df.columns.tolist(), df.to_dict(orient='records')
+
 def fetch_from_excel(config):
     """Fetch data from Excel file"""
     try:
@@ -100,43 +189,51 @@ def fetch_from_excel(config):
         sheet_name = config.get('sheetName')
         
         if not file_path:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'File path not specified'
             })
             
         # Check if file exists
         if not os.path.exists(file_path):
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': f'File not found: {file_path}'
             })
             
         # Read Excel file
-        if sheet_name:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+        if isinstance(sheet_name, list) and sheet_name:
+            # Read all requested sheets from a single pass over the workbook
+            sheets = pd.read_excel(file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
+            df = pd.concat(sheets.values(), ignore_index=True)
+        elif sheet_name:
+            df = pd.read_excel(file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
         else:
-            df = pd.read_excel(file_path)
+            df = pd.read_excel(file_path, engine=EXCEL_ENGINE)
+        
+        # Return columnar Arrow data if requested
+        if config.get('format') == 'arrow':
+            return arrow_response(df)
         
         # Basic data info
         data_info = {
             'row_count': len(df),
             'column_count': len(df.columns),
             'columns': df.columns.tolist(),
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'fetched_at': _timestamp()
         }
         
         # Convert to records
         records = df.to_dict(orient='records')
         
-        return json.dumps({
+        return _dumps({
             'success': True,
             'info': data_info,
             'data': records
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
@@ -146,49 +243,10 @@ def fetch_from_bigquery(config):
     try:
         # In a real implementation, this would use the google-cloud-bigquery package
         # For this demo, we'll return mock data
-        
-        # Mock data generation
-        date_range = pd.date_range(start='2025-01-01', periods=90)
-        channels = ['Paid Search', 'Social Media', 'Email', 'Display']
-        
-        data = []
-        for date in date_range:
-            row = {'date': date.strftime('%Y-%m-%d')}
-            
-            # Add channel data
-            for channel in channels:
-                # Generate some random spend data
-                row[f'{channel}_spend'] = round(np.random.gamma(2, 100), 2)
-                
-                # Generate some random performance metrics
-                row[f'{channel}_impressions'] = int(np.random.gamma(2, 1000))
-                row[f'{channel}_clicks'] = int(np.random.gamma(2, 50))
-                row[f'{channel}_conversions'] = int(np.random.gamma(2, 5))
-            
-            # Add revenue data with some relationship to marketing
-            base_revenue = 5000
-            marketing_effect = sum([row[f'{channel}_spend'] * np.random.uniform(0.5, 2.0) for channel in channels])
-            row['revenue'] = round(base_revenue + marketing_effect + np.random.normal(0, 1000), 2)
-            
-            data.append(row)
-        
-        # Basic data info
-        data_info = {
-            'row_count': len(data),
-            'column_count': len(data[0]) if data else 0,
-            'columns': list(data[0].keys()) if data else [],
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'source': 'BigQuery (mock data)'
-        }
-        
-        return json.dumps({
-            'success': True,
-            'info': data_info,
-            'data': data
-        })
+        return generate_mock_data('BigQuery (mock data)', config)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
@@ -198,49 +256,10 @@ def fetch_from_spreadsheet(config):
     try:
         # In a real implementation, this would use the gspread package
         # For this demo, we'll return mock data
-        
-        # Mock data generation
-        date_range = pd.date_range(start='2025-01-01', periods=90)
-        channels = ['Paid Search', 'Social Media', 'Email', 'Display']
-        
-        data = []
-        for date in date_range:
-            row = {'date': date.strftime('%Y-%m-%d')}
-            
-            # Add channel data
-            for channel in channels:
-                # Generate some random spend data
-                row[f'{channel}_spend'] = round(np.random.gamma(2, 100), 2)
-                
-                # Generate some random performance metrics
-                row[f'{channel}_impressions'] = int(np.random.gamma(2, 1000))
-                row[f'{channel}_clicks'] = int(np.random.gamma(2, 50))
-                row[f'{channel}_conversions'] = int(np.random.gamma(2, 5))
-            
-            # Add revenue data with some relationship to marketing
-            base_revenue = 5000
-            marketing_effect = sum([row[f'{channel}_spend'] * np.random.uniform(0.5, 2.0) for channel in channels])
-            row['revenue'] = round(base_revenue + marketing_effect + np.random.normal(0, 1000), 2)
-            
-            data.append(row)
-        
-        # Basic data info
-        data_info = {
-            'row_count': len(data),
-            'column_count': len(data[0]) if data else 0,
-            'columns': list(data[0].keys()) if data else [],
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'source': 'Google Spreadsheet (mock data)'
-        }
-        
-        return json.dumps({
-            'success': True,
-            'info': data_info,
-            'data': data
-        })
+        return generate_mock_data('Google Spreadsheet (mock data)', config)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
@@ -250,53 +269,104 @@ def fetch_from_database(config):
     try:
         # In a real implementation, this would use SQLAlchemy
         # For this demo, we'll return mock data
-        
-        # Mock data generation
-        date_range = pd.date_range(start='2025-01-01', periods=90)
-        channels = ['Paid Search', 'Social Media', 'Email', 'Display']
-        
-        data = []
-        for date in date_range:
-            row = {'date': date.strftime('%Y-%m-%d')}
-            
-            # Add channel data
-            for channel in channels:
-                # Generate some random spend data
-                row[f'{channel}_spend'] = round(np.random.gamma(2, 100), 2)
-                
-                # Generate some random performance metrics
-                row[f'{channel}_impressions'] = int(np.random.gamma(2, 1000))
-                row[f'{channel}_clicks'] = int(np.random.gamma(2, 50))
-                row[f'{channel}_conversions'] = int(np.random.gamma(2, 5))
-            
-            # Add revenue data with some relationship to marketing
-            base_revenue = 5000
-            marketing_effect = sum([row[f'{channel}_spend'] * np.random.uniform(0.5, 2.0) for channel in channels])
-            row['revenue'] = round(base_revenue + marketing_effect + np.random.normal(0, 1000), 2)
-            
-            data.append(row)
-        
-        # Basic data info
-        data_info = {
-            'row_count': len(data),
-            'column_count': len(data[0]) if data else 0,
-            'columns': list(data[0].keys()) if data else [],
-            'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'source': 'Database (mock data)'
-        }
-        
-        return json.dumps({
-            'success': True,
-            'info': data_info,
-            'data': data
-        })
+        return generate_mock_data('Database (mock data)', config)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
 
+def generate_mock_data(source, config, periods=90):
+    """Generate mock daily marketing data, one column at a time"""
+    rng = np.random.default_rng()
+    date_range = pd.date_range(start='2025-01-01', periods=periods)
+    channels = ['Paid Search', 'Social Media', 'Email', 'Display']
+    
+    columns = {'date': date_range.strftime('%Y-%m-%d')}
+    marketing_effect = np.zeros(periods)
+    for channel in channels:
+        # Generate some random spend data
+        spend = rng.gamma(2, 100, periods).round(2)
+        columns[f'{channel}_spend'] = spend
+        
+        # Generate some random performance metrics
+        columns[f'{channel}_impressions'] = rng.gamma(2, 1000, periods).astype(np.int64)
+        columns[f'{channel}_clicks'] = rng.gamma(2, 50, periods).astype(np.int64)
+        columns[f'{channel}_conversions'] = rng.gamma(2, 5, periods).astype(np.int64)
+        
+        marketing_effect += spend * rng.uniform(0.5, 2.0, periods)
+    
+    # Add revenue data with some relationship to marketing
+    base_revenue = 5000
+    columns['revenue'] = (base_revenue + marketing_effect + rng.normal(0, 1000, periods)).round(2)
+    
+    df = pd.DataFrame(columns)
+    
+    # Return columnar Arrow data if requested
+    if config.get('format') == 'arrow':
+        return arrow_response(df, source=source)
+    
+    data = df.to_dict(orient='records')
+    
+    # Basic data info
+    data_info = {
+        'row_count': len(data),
+        'column_count': len(columns),
+        'columns': list(columns),
+        'fetched_at': _timestamp(),
+        'source': source
+    }
+    
+    return _dumps({
+        'success': True,
+        'info': data_info,
+        'data': data
+    })
+
+def arrow_response(data, **info):
+    """
+    Build a response carrying the data as a base64-encoded Arrow IPC stream.
+    
+    Args:
+        data: pyarrow Table or pandas DataFrame with the fetched data
+        **info: Extra fields for the response info block
+    
+    Returns:
+        JSON string with the encoded data
+    """
+    if isinstance(data, pd.DataFrame):
+        data = pa.Table.from_pandas(data, preserve_index=False)
+    
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, data.schema) as writer:
+        writer.write_table(data)
+    
+    # Basic data info
+    data_info = {
+        'row_count': data.num_rows,
+        'column_count': data.num_columns,
+        'columns': data.column_names,
+        'fetched_at': _timestamp(),
+        'format': 'arrow',
+        **info
+    }
+    
+    return _dumps({
+        'success': True,
+        'info': data_info,
+        'data': base64.b64encode(sink.getvalue().to_pybytes()).decode('ascii')
+    })
+
+# Fetch functions by source type
+SOURCE_FETCHERS = {
+    'csv': fetch_from_csv,
+    'excel': fetch_from_excel,
+    'bigquery': fetch_from_bigquery,
+    'spreadsheet': fetch_from_spreadsheet,
+    'database': fetch_from_database
+}
+
 if __name__ == "__main__":
     # Get input data from command line arguments
     if len(sys.argv) > 1:
@@ -304,7 +374,7 @@ if __name__ == "__main__":
         result = fetch_data_from_source(config_json)
         print(result)
     else:
-        print(json.dumps({
+        print(_dumps({
             'success': False,
             'message': 'No configuration provided'
         }))
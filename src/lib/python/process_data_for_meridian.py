@@ -1,10 +1,69 @@
 
+import argparse
 import json
 import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+def _loads(text):
+    """Parse a JSON string or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _dumps(obj):
+    """Serialize a response to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_numpy_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, default=_numpy_default)
+
+def _numpy_default(value):
+    """Convert numpy values the JSON encoder cannot handle natively"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def column_values(series):
+    """Column values as a contiguous numpy array when numeric, otherwise as a list"""
+    values = series.to_numpy()
+    if values.dtype.kind in 'biuf':
+        # A column sliced out of a row-major block is strided; orjson only
+        # serializes contiguous arrays natively. This is a no-op otherwise.
+        return np.ascontiguousarray(values)
+    return series.tolist()
+
+def records_frame(records):
+    """Build a DataFrame from a list of flat record dicts"""
+    if pa is None:
+        return pd.DataFrame(records)
+    
+    # pyarrow converts the records straight into typed columns; mixed-type,
+    # nested or non-record input is left to pandas
+    try:
+        array = pa.array(records)
+        # pyarrow would turn null entries into all-null rows
+        if array.null_count:
+            return pd.DataFrame(records)
+        table = pa.Table.from_struct_array(array)
+    except (pa.ArrowException, TypeError, OverflowError):
+        return pd.DataFrame(records)
+    if any(pa.types.is_nested(field.type) for field in table.schema):
+        return pd.DataFrame(records)
+    return table.to_pandas(use_threads=True)
+
 def process_data_for_meridian(data_json, config_json=None):
     """
     Process marketing data for use with Meridian MMM.
@@ -18,44 +77,49 @@ def process_data_for_meridian(data_json, config_json=None):
     """
     try:
         # Parse input data
-        data = json.loads(data_json)
-        config = json.loads(config_json) if config_json else {}
+        data = _loads(data_json)
+        config = _loads(config_json) if config_json else {}
         
         # Convert to DataFrame if it's a list of records
         if isinstance(data, list):
-            df = pd.DataFrame(data)
+            df = records_frame(data)
         else:
             # Handle nested data structure
             if 'records' in data:
-                df = pd.DataFrame(data['records'])
+                df = records_frame(data['records'])
             else:
-                # Try to flatten the structure
-                flattened_data = []
-                for key, value in data.items():
-                    if isinstance(value, dict):
-                        row = {'date': key}
-                        row.update(value)
-                        flattened_data.append(row)
-                df = pd.DataFrame(flattened_data)
+                # Try to flatten the structure into one list per column,
+                # so pandas builds each column directly instead of from row dicts
+                rows = [(key, value) for key, value in data.items() if isinstance(value, dict)]
+                columns = {}
+                for _, value in rows:
+                    columns.update(dict.fromkeys(value))
+                columns.pop('date', None)
+                df = pd.DataFrame({
+                    'date': [value.get('date', key) for key, value in rows],
+                    **{col: [value.get(col) for _, value in rows] for col in columns}
+                })
         
         # Ensure date column is datetime
         date_column = config.get('date_column', 'date')
         if date_column in df.columns:
             df[date_column] = pd.to_datetime(df[date_column])
-            df = df.sort_values(by=date_column)
+            # Exports are usually chronological already, so only sort when needed
+            if not df[date_column].is_monotonic_increasing:
+                df = df.sort_values(by=date_column, kind='mergesort')
         
         # Identify target (KPI) column
         target_column = config.get('target_column')
         if not target_column:
             # Try to guess based on common names
-            potential_targets = ['revenue', 'sales', 'conversions', 'kpi', 'target']
-            for col in potential_targets:
-                if col in df.columns:
+            column_names = set(df.columns)
+            for col in ('revenue', 'sales', 'conversions', 'kpi', 'target'):
+                if col in column_names:
                     target_column = col
                     break
         
         if not target_column or target_column not in df.columns:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'Target KPI column not found or specified'
             })
@@ -63,18 +127,19 @@ def process_data_for_meridian(data_json, config_json=None):
         # Identify marketing channel columns
         channel_columns = config.get('channel_columns', [])
         if not channel_columns:
-            # Try to guess based on common patterns
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
-            # Exclude date and target columns
-            potential_channels = [col for col in numeric_cols 
-                                if col != target_column and 'date' not in col.lower()]
-            channel_columns = potential_channels
+            # Try to guess based on common patterns, walking the column dtypes
+            # directly rather than building a numeric-only frame first
+            numeric = np.fromiter((issubclass(dtype.type, np.number) for dtype in df.dtypes),
+                                  dtype=bool, count=len(df.columns))
+            # Exclude date and target columns, matching all names in one vectorized pass
+            is_date = df.columns.astype(str).str.contains('date', case=False, regex=False)
+            channel_columns = df.columns[numeric & ~is_date & (df.columns != target_column)].tolist()
         
         # Validate channel columns exist
         channel_columns = [col for col in channel_columns if col in df.columns]
         
         if not channel_columns:
-            return json.dumps({
+            return _dumps({
                 'success': False,
                 'message': 'No marketing channel columns found or specified'
             })
@@ -83,26 +148,37 @@ def process_data_for_meridian(data_json, config_json=None):
         control_columns = config.get('control_columns', [])
         control_columns = [col for col in control_columns if col in df.columns]
         
+        # Format dates in a single vectorized numpy pass; the frame is sorted,
+        # so the range is its first and last valid date
+        dates = df[date_column]
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        date_values = dates.to_numpy(dtype='datetime64[D]')
+        missing_dates = np.isnat(date_values)
+        date_strings = np.datetime_as_string(date_values, unit='D')
+        date_bounds = date_strings[~missing_dates]
+        date_list = date_strings.astype(object)
+        date_list[missing_dates] = None
+        
         # Format data for Meridian
         meridian_data = {
-            'date': df[date_column].dt.strftime('%Y-%m-%d').tolist(),
-            'target': df[target_column].tolist(),
-            'channels': {}
+            'date': date_list.tolist(),
+            'target': column_values(df[target_column]),
+            # Slice the selected columns once and walk them, rather than
+            # looking each one up on the full frame
+            'channels': {col: column_values(values)
+                         for col, values in df.loc[:, channel_columns].items()}
         }
         
-        for channel in channel_columns:
-            meridian_data['channels'][channel] = df[channel].tolist()
-        
         if control_columns:
-            meridian_data['controls'] = {}
-            for control in control_columns:
-                meridian_data['controls'][control] = df[control].tolist()
+            meridian_data['controls'] = {col: column_values(values)
+                                         for col, values in df.loc[:, control_columns].items()}
         
         # Add metadata
         meridian_data['metadata'] = {
             'date_range': {
-                'start': df[date_column].min().strftime('%Y-%m-%d'),
-                'end': df[date_column].max().strftime('%Y-%m-%d')
+                'start': str(date_bounds[0]),
+                'end': str(date_bounds[-1])
             },
             'target_column': target_column,
             'channel_columns': channel_columns,
@@ -111,27 +187,51 @@ def process_data_for_meridian(data_json, config_json=None):
             'processed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        return json.dumps({
+        return _dumps({
             'success': True,
             'data': meridian_data
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'success': False,
             'message': str(e)
         })
 
+def read_input(path):
+    """Read raw JSON bytes from a file path, or from stdin when the path is '-'"""
+    if path == '-':
+        return sys.stdin.buffer.read()
+    with open(path, 'rb') as f:
+        return f.read()
+
 if __name__ == "__main__":
-    # Get input data from command line arguments
-    if len(sys.argv) > 1:
-        data_json = sys.argv[1]
-        config_json = sys.argv[2] if len(sys.argv) > 2 else None
-        
+    # Input data can be passed inline, as '-' to read it from stdin, or as a file.
+    # stdin and files avoid the OS limit on command line argument size.
+    parser = argparse.ArgumentParser(description='Process marketing data for Meridian')
+    parser.add_argument('data_json', nargs='?', help="JSON string with the marketing data, or '-' for stdin")
+    parser.add_argument('config_json', nargs='?', help='JSON string with processing configuration')
+    parser.add_argument('--data-file', help='Path to a JSON file with the marketing data')
+    parser.add_argument('--config-file', help='Path to a JSON file with processing configuration')
+    args = parser.parse_args()
+    
+    try:
+        data_json = read_input(args.data_file) if args.data_file else args.data_json
+        if data_json == '-':
+            data_json = read_input('-')
+        config_json = read_input(args.config_file) if args.config_file else args.config_json
+    except OSError as e:
+        print(_dumps({
+            'success': False,
+            'message': str(e)
+        }))
+        sys.exit()
+    
+    if data_json:
         result = process_data_for_meridian(data_json, config_json)
         print(result)
     else:
-        print(json.dumps({
+        print(_dumps({
             'success': False,
             'message': 'No input data provided'
         }))